@@ -1,60 +1,106 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
+import bcrypt
+import jwt
 from fastapi import Request, Response, HTTPException, status
-from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from .cache import cache_delete, cache_get, cache_set
 from .config import settings
 from .models import User
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-serializer = URLSafeTimedSerializer(settings.secret_key)
-
 SESSION_MAX_AGE_SECONDS = 60 * 60 * 24 * 7  # 7 days
 BCRYPT_MAX_LENGTH = 72  # bcrypt only uses the first 72 bytes
+USER_CACHE_TTL_SECONDS = 60
+_COOKIE = settings.session_cookie_name  # hoisted: read on every request
+
+_bcrypt_pool: ProcessPoolExecutor | None = None
 
 
-def _truncate_for_bcrypt(password: str) -> str:
-    """Ensure passwords passed to bcrypt are within its length limit.
+def _truncate_for_bcrypt(password: str) -> bytes:
+    """Encode a password and clamp it to bcrypt's length limit.
 
-    bcrypt ignores everything beyond 72 bytes; passlib raises an error instead.
-    For this demo app, we simply truncate to 72 characters so very long
-    passwords don't crash registration/login.
+    bcrypt ignores everything beyond 72 bytes; newer bcrypt releases raise an
+    error instead. For this demo app, we simply truncate to 72 bytes so very
+    long passwords don't crash registration/login.
     """
 
-    if len(password) <= BCRYPT_MAX_LENGTH:
-        return password
-    return password[:BCRYPT_MAX_LENGTH]
+    return password.encode("utf-8")[:BCRYPT_MAX_LENGTH]
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(_truncate_for_bcrypt(password))
-
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_cost)
+    return bcrypt.hashpw(_truncate_for_bcrypt(password), salt).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(_truncate_for_bcrypt(plain_password), hashed_password)
+    return bcrypt.checkpw(_truncate_for_bcrypt(plain_password), hashed_password.encode("utf-8"))
+
+
+def _get_bcrypt_pool() -> ProcessPoolExecutor:
+    """Return the bcrypt worker pool, creating it on first use.
+
+    bcrypt is CPU-bound; running it in worker processes keeps it off the event
+    loop. Workers come from a forkserver: by the first login the web process
+    already runs threads (event loop, asyncpg, gRPC) that are not safe to fork.
+    """
+
+    global _bcrypt_pool
+    if _bcrypt_pool is None:
+        _bcrypt_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _bcrypt_pool
+
+
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_bcrypt_pool(), hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_bcrypt_pool(), verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_pool() -> None:
+    """Stop the bcrypt workers without blocking; the next call starts a new pool."""
+
+    global _bcrypt_pool
+    if _bcrypt_pool is not None:
+        _bcrypt_pool.shutdown(wait=False, cancel_futures=True)
+        _bcrypt_pool = None
+
 
 def create_session_token(user_id: int) -> str:
-    return serializer.dumps({"user_id": user_id})
+    payload = {"uid": user_id, "exp": int(time.time()) + SESSION_MAX_AGE_SECONDS}
+    return jwt.encode(payload, settings.secret_key, algorithm="HS256")
 
 
 def get_user_id_from_token(token: str) -> Optional[int]:
     try:
-        data = serializer.loads(token, max_age=SESSION_MAX_AGE_SECONDS)
-    except SignatureExpired:
-        return None
-    except BadSignature:
+        data = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+    except jwt.PyJWTError:
         return None
-    return int(data.get("user_id"))
+    return int(data["uid"])
 
 
 def set_session_cookie(response: Response, token: str) -> None:
     response.set_cookie(
-        key=settings.session_cookie_name,
+        key=_COOKIE,
         value=token,
         httponly=True,
         secure=False,  # set True when behind HTTPS in production
@@ -64,31 +110,126 @@ def set_session_cookie(response: Response, token: str) -> None:
 
 
 def clear_session_cookie(response: Response) -> None:
-    response.delete_cookie(settings.session_cookie_name)
+    response.delete_cookie(_COOKIE)
 
 
-def get_current_user(request: Request, db: Session) -> Optional[User]:
-    token = request.cookies.get(settings.session_cookie_name)
+def _user_id_from_request(request: Request) -> Optional[int]:
+    token = request.cookies.get(_COOKIE)
     if not token:
         return None
-    user_id = get_user_id_from_token(token)
+    return get_user_id_from_token(token)
+
+
+async def _load_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    stmt = select(User).options(selectinload(User.roles)).where(User.id == user_id)
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def get_current_user(request: Request, db: AsyncSession) -> Optional[User]:
+    user_id = _user_id_from_request(request)
     if not user_id:
         return None
-    return db.get(User, user_id)
+    return await _load_user(db, user_id)
 
 
-def require_authenticated_user(request: Request, db: Session) -> User:
-    user = get_current_user(request, db)
+@dataclass(frozen=True)
+class CurrentUser:
+    """Plain snapshot of the authenticated user handed to route handlers.
+
+    Not an ORM object, so it can be cached in Redis and can never be added to
+    a session by accident.
+    """
+
+    id: int
+    email: str
+    is_active: bool
+    is_superuser: bool
+    role_names: frozenset[str]
+
+    @classmethod
+    def from_user(cls, user: User) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            role_names=frozenset(role.name for role in user.roles),
+        )
+
+
+def _user_cache_key(user_id: int) -> str:
+    return f"auth:user:{user_id}"
+
+
+async def get_user_cached(user_id: int) -> Optional[CurrentUser]:
+    """Return the cached snapshot of a user, if present.
+
+    Returns None when Redis is unavailable.
+    """
+
+    try:
+        data = await cache_get(_user_cache_key(user_id))
+    except RedisError as exc:
+        logger.warning("User cache read failed, falling back to DB: {}", exc)
+        return None
+    if data is None:
+        return None
+    return CurrentUser(
+        id=data["id"],
+        email=data["email"],
+        is_active=data["is_active"],
+        is_superuser=data["is_superuser"],
+        role_names=frozenset(data["role_names"]),
+    )
+
+
+async def cache_user(user: CurrentUser) -> None:
+    data = {
+        "id": user.id,
+        "email": user.email,
+        "is_active": user.is_active,
+        "is_superuser": user.is_superuser,
+        "role_names": sorted(user.role_names),
+    }
+    try:
+        await cache_set(_user_cache_key(user.id), data, ttl=USER_CACHE_TTL_SECONDS)
+    except RedisError as exc:
+        logger.warning("User cache write failed: {}", exc)
+
+
+async def invalidate_user_cache(user_id: int) -> None:
+    """Drop the cached snapshot; call after changing a user's roles or flags.
+
+    A Redis failure is logged, not raised, so it can't fail a request whose DB
+    change already committed; the stale entry then expires after
+    USER_CACHE_TTL_SECONDS.
+    """
+
+    try:
+        await cache_delete(_user_cache_key(user_id))
+    except RedisError as exc:
+        logger.warning("User cache invalidation failed: {}", exc)
+
+
+async def require_authenticated_user(request: Request, db: AsyncSession) -> CurrentUser:
+    user_id = _user_id_from_request(request)
+    user = None
+    if user_id:
+        user = await get_user_cached(user_id)
+        if user is None:
+            db_user = await _load_user(db, user_id)
+            if db_user is not None:
+                user = CurrentUser.from_user(db_user)
+                await cache_user(user)
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
     return user
 
 
-def require_role(request: Request, db: Session, roles: list[str]) -> User:
-    user = require_authenticated_user(request, db)
+async def require_role(request: Request, db: AsyncSession, roles: frozenset[str]) -> CurrentUser:
+    user = await require_authenticated_user(request, db)
     if user.is_superuser:
         return user
-    user_roles = {role.name for role in user.roles}
-    if not user_roles.intersection(set(roles)):
+    if not user.role_names & roles:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
     return user
@@ -2,51 +2,105 @@ from __future__ import annotations
 
 import asyncio
 import functools
-import json
+import hashlib
+from datetime import date
 from typing import Any, Callable, Awaitable
+from uuid import UUID
 
+import orjson
 import redis.asyncio as redis
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .config import settings
 
 
-_redis_client: redis.Redis | None = None
+# Blocking pool: when all connections are busy, callers wait for one instead of erroring.
+pool = redis.BlockingConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=settings.redis_max_connections,
+    timeout=settings.redis_pool_timeout,
+    decode_responses=False,
+)
+_redis_client: redis.Redis = redis.Redis(connection_pool=pool)
 
 
-def get_redis() -> redis.Redis | None:
-    global _redis_client
-    if _redis_client is None:
-        _redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+def get_redis() -> redis.Redis:
     return _redis_client
 
 
-async def cache_get(key: str) -> Any | None:
+async def close_redis() -> None:
+    await _redis_client.aclose()
+    await pool.disconnect()
+
+
+async def cache_get(key: str | bytes) -> Any | None:
     client = get_redis()
-    if client is None:
-        return None
     value = await client.get(key)
     if value is None:
         return None
-    return json.loads(value)
+    return orjson.loads(value)
 
 
-async def cache_set(key: str, value: Any, ttl: int = 60) -> None:
+async def cache_set(key: str | bytes, value: Any, ttl: int = 60) -> None:
     client = get_redis()
-    if client is None:
-        return
-    await client.setex(key, ttl, json.dumps(value))
+    await client.setex(key, ttl, orjson.dumps(value))
+
+
+async def cache_delete(key: str | bytes) -> None:
+    client = get_redis()
+    await client.delete(key)
+
+
+# Per-call plumbing that never changes what a cached function returns.
+_KEY_SKIP_TYPES = (AsyncSession,)
+
+
+def _key_part(value: Any) -> list[Any]:
+    """Encode one argument as a type-tagged, JSON-safe value for a cache key.
+
+    Raises TypeError for values without a stable encoding; such functions
+    need an explicit ``key_builder``.
+    """
+
+    kind = type(value).__qualname__
+    if value is None or isinstance(value, (str, bool)):
+        return [kind, value]
+    if isinstance(value, (int, float)):
+        # repr keeps ints wider than 64 bits (which orjson rejects) and nan/inf distinct.
+        return [kind, repr(value)]
+    if isinstance(value, (list, tuple)):
+        return [kind, [_key_part(v) for v in value]]
+    if isinstance(value, (date, UUID)):
+        return [kind, str(value)]
+    raise TypeError(f"cannot build a cache key from a {kind} argument; pass key_builder to cached()")
+
+
+def _default_key(prefix: bytes, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bytes:
+    """Build a stable cache key from the arguments of a call.
+
+    DB sessions are skipped so their reprs, which contain memory addresses,
+    don't make every key unique. Every other argument is part of the key.
+    """
+
+    parts = (
+        [_key_part(a) for a in args if not isinstance(a, _KEY_SKIP_TYPES)],
+        [[k, _key_part(v)] for k, v in sorted(kwargs.items()) if not isinstance(v, _KEY_SKIP_TYPES)],
+    )
+    return prefix + hashlib.blake2b(orjson.dumps(parts), digest_size=12).digest()
 
 
 def cached(ttl: int = 60, key_builder: Callable[..., str] | None = None):
     """Decorator to cache async function results in Redis."""
 
     def decorator(func: Callable[..., Awaitable[Any]]):
+        prefix = f"{func.__module__}:{func.__qualname__}:".encode()
+
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             if key_builder:
                 key = key_builder(*args, **kwargs)
             else:
-                key = f"{func.__module__}:{func.__name__}:{args}:{kwargs}"
+                key = _default_key(prefix, args, kwargs)
             cached_value = await cache_get(key)
             if cached_value is not None:
                 return cached_value
@@ -8,9 +8,16 @@ class Settings(BaseSettings):
     environment: str = "dev"  # dev, staging, prod
     secret_key: str = "change-me"  # override in env/Cloud Run
     session_cookie_name: str = "session"
+    bcrypt_cost: int = 12
 
-    database_url: str = "postgresql+psycopg2://postgres:postgres@db:5432/app"
+    database_url: str = "postgresql+asyncpg://postgres:postgres@db:5432/app"
+    db_pool_size: int = 30
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800  # seconds; stay under server-side idle timeouts
+    db_pool_timeout: int = 30  # seconds to wait for a free connection
     redis_url: str = "redis://redis:6379/0"
+    redis_max_connections: int = 50
+    redis_pool_timeout: int = 5  # seconds to wait for a free connection
 
     gcp_project_id: str | None = None
     gcp_region: str | None = None
@@ -1,36 +1,39 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 
 from fastapi import Depends, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .db import get_db
-from .auth import get_current_user, require_authenticated_user, require_role
+from .auth import CurrentUser, get_current_user, require_authenticated_user, require_role
 from .models import User
 
 
-def db_session_dep() -> Generator[Session, None, None]:
-    yield from get_db()
+async def db_session_dep() -> AsyncGenerator[AsyncSession, None]:
+    async for db in get_db():
+        yield db
 
 
-def current_user_dep(
+async def current_user_dep(
     request: Request,
-    db: Session = Depends(db_session_dep),
+    db: AsyncSession = Depends(db_session_dep),
 ) -> User | None:
-    return get_current_user(request, db)
+    return await get_current_user(request, db)
 
 
-def authenticated_user_dep(
+async def authenticated_user_dep(
     request: Request,
-    db: Session = Depends(db_session_dep),
-) -> User:
-    return require_authenticated_user(request, db)
+    db: AsyncSession = Depends(db_session_dep),
+) -> CurrentUser:
+    return await require_authenticated_user(request, db)
 
 
 def role_required_dep(*roles: str):
-    def _dep(
+    roles_set = frozenset(roles)
+
+    async def _dep(
         request: Request,
-        db: Session = Depends(db_session_dep),
-    ) -> User:
-        return require_role(request, db, list(roles))
+        db: AsyncSession = Depends(db_session_dep),
+    ) -> CurrentUser:
+        return await require_role(request, db, roles_set)
 
     return _dep
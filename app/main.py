@@ -1,40 +1,79 @@
-from fastapi import FastAPI, Request, Depends
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
 from loguru import logger
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from sqlalchemy import text
 
+from .auth import shutdown_password_pool
+from .cache import close_redis, get_redis
 from .config import settings
+from .db import Base, engine
+from .queues import get_publisher, stop_publisher
+from .templating import templates
 from .routes import auth as auth_routes
 from .routes import views as view_routes
 from .routes import api as api_routes
 
-app = FastAPI(title="Fullstack GCP App", version="0.1.0")
 
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+async def _create_tables() -> None:
+    """Auto-create DB tables in dev.
 
-templates = Jinja2Templates(directory="app/templates")
+    In staging/prod (e.g. Cloud Run), we skip this so startup does not depend
+    on direct DB access or migrations.
+    """
 
+    if settings.environment.lower() != "dev":
+        logger.info("Skipping automatic DB schema creation (environment={})", settings.environment)
+        return
 
-from .db import Base, engine  # noqa: E402
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Error creating database tables on startup: {}", exc)
 
 
-@app.on_event("startup")
-async def on_startup() -> None:
-    """Application startup hook.
+async def _warm_connections() -> None:
+    """Open the first DB/Redis connections and build the Pub/Sub client.
 
-    In the dev environment we auto-create DB tables for convenience. In
-    staging/prod (e.g. Cloud Run), we skip this so startup does not depend
-    on direct DB access or migrations.
+    Failures are logged rather than raised so the app can still start (and
+    serve /healthz) while a backing service is unavailable.
     """
 
-    if settings.environment.lower() == "dev":
-        try:
-            Base.metadata.create_all(bind=engine)
-        except Exception as exc:  # noqa: BLE001
-            logger.error("Error creating database tables on startup: {}", exc)
-    else:
-        logger.info("Skipping automatic DB schema creation (environment=%s)", settings.environment)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Could not warm DB connection pool: {}", exc)
+
+    try:
+        await get_redis().ping()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Could not connect to Redis on startup: {}", exc)
+
+    try:
+        get_publisher()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Could not create Pub/Sub publisher on startup: {}", exc)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await _create_tables()
+    await _warm_connections()
+    yield
+    shutdown_password_pool()
+    await close_redis()
+    await asyncio.to_thread(stop_publisher)
+    await engine.dispose()
+
+
+app = FastAPI(title="Fullstack GCP App", version="0.1.0", lifespan=lifespan)
+
+app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 
 @app.get("/healthz", tags=["health"])
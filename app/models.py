@@ -1,11 +1,17 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Table, UniqueConstraint
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Table, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
 
 from .db import Base
 
 
+def _utc_now():
+    # now() is timestamptz; store UTC in the naive DateTime columns, as datetime.utcnow did.
+    return func.timezone("utc", func.now())
+
+
 user_roles = Table(
     "user_roles",
     Base.metadata,
@@ -22,7 +28,7 @@ class User(Base):
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=_utc_now())
 
     roles: Mapped[list["Role"]] = relationship("Role", secondary=user_roles, back_populates="users")
     todos: Mapped[list["Todo"]] = relationship(
@@ -48,30 +54,32 @@ class ExampleItem(Base):
     """
 
     __tablename__ = "example_items"
+    # Postgres backs the unique constraint with a unique index, which also serves slug lookups.
     __table_args__ = (UniqueConstraint("slug", name="uq_example_items_slug"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     slug: Mapped[str] = mapped_column(String(100), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(String(1024), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=_utc_now(), index=True)
 
 
 class Todo(Base):
     """Simple per-user todo item for the main app UI."""
 
     __tablename__ = "todos"
+    # Leading user_id column also serves plain user_id lookups.
+    __table_args__ = (Index("ix_todos_user_created", "user_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE"),
-        index=True,
         nullable=False,
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(String(1024), nullable=True)
     is_done: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=_utc_now())
 
     user: Mapped["User"] = relationship("User", back_populates="todos")
@@ -1,5 +1,8 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import hashlib
+
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..cache import cached
 from ..db import get_db
@@ -11,14 +14,44 @@ from ..queues import publish_event
 router = APIRouter()
 
 
-@router.get("/items")
+async def _items_etag(db: AsyncSession) -> str:
+    """Derive an ETag for /items from the newest timestamp and row count."""
+
+    stmt = select(func.max(ExampleItem.created_at), func.count()).select_from(ExampleItem)
+    latest, count = (await db.execute(stmt)).one()
+    digest = hashlib.blake2b(f"{latest}:{count}".encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
 @cached(ttl=30)
-async def list_items(db: Session = Depends(get_db)):
-    items = db.query(ExampleItem).order_by(ExampleItem.created_at.desc()).limit(100).all()
-    return [
-        {"id": i.id, "slug": i.slug, "name": i.name, "description": i.description}
-        for i in items
-    ]
+async def _recent_items(db: AsyncSession, etag: str) -> list[dict]:
+    # etag is unused here but keys the cache, so a cached body always matches its validator.
+    stmt = (
+        select(ExampleItem.id, ExampleItem.slug, ExampleItem.name, ExampleItem.description)
+        .order_by(ExampleItem.created_at.desc())
+        .limit(100)
+    )
+    rows = (await db.execute(stmt)).all()
+    return [dict(r._mapping) for r in rows]
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires: W/ prefixes are ignored and * matches."""
+
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@router.get("/items")
+async def list_items(request: Request, response: Response, db: AsyncSession = Depends(get_db)):
+    etag = await _items_etag(db)
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return await _recent_items(db, etag)
 
 
 @router.post("/items/{item_id}/process")
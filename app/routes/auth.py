@@ -1,16 +1,14 @@
 from fastapi import APIRouter, Depends, Form, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..auth import hash_password, verify_password, create_session_token, set_session_cookie, clear_session_cookie
+from ..auth import hash_password_async, verify_password_async, create_session_token, set_session_cookie, clear_session_cookie
 from ..db import get_db
 from ..models import User, Role
+from ..templating import templates
 
 
-templates = Jinja2Templates(directory="app/templates")
-
 router = APIRouter()
 
 
@@ -24,11 +22,11 @@ async def login(
     request: Request,
     email: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     stmt = select(User).where(User.email == email)
-    user = db.execute(stmt).scalar_one_or_none()
-    if not user or not verify_password(password, user.hashed_password):
+    user = (await db.execute(stmt)).scalar_one_or_none()
+    if not user or not await verify_password_async(password, user.hashed_password):
         # Re-render login with error
         return templates.TemplateResponse(
             "auth/login.html",
@@ -52,9 +50,9 @@ async def register(
     request: Request,
     email: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    existing = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+    existing = (await db.execute(select(User).where(User.email == email))).scalar_one_or_none()
     if existing:
         return templates.TemplateResponse(
             "auth/register.html",
@@ -62,10 +60,10 @@ async def register(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    user = User(email=email, hashed_password=hash_password(password))
+    user = User(email=email, hashed_password=await hash_password_async(password))
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     token = create_session_token(user.id)
     response = RedirectResponse(url="/dashboard", status_code=status.HTTP_302_FOUND)
@@ -0,0 +1,11 @@
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from .config import settings
+
+
+# Single Jinja environment shared by every router, so compiled templates are reused.
+templates = Jinja2Templates(directory="app/templates")
+templates.env.auto_reload = settings.environment.lower() == "dev"
+# No directory argument: Jinja uses a private per-user temp dir and checks its ownership.
+templates.env.bytecode_cache = FileSystemBytecodeCache()
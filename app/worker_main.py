@@ -3,7 +3,7 @@ import json
 
 from fastapi import FastAPI, Header, HTTPException, Request
 
-from .db import get_db
+from .db import SessionLocal
 from .models import ExampleItem
 
 
@@ -37,9 +37,5 @@ async def handle_process_item(payload: dict):
     if not item_id:
         return
     # For demonstration we just load the item to prove DB access works; real logic would go here.
-    db_gen = get_db()
-    db = next(db_gen)
-    try:
-        _ = db.get(ExampleItem, item_id)
-    finally:
-        db_gen.close()  # type: ignore[call-arg]
+    async with SessionLocal() as db:
+        _ = await db.get(ExampleItem, item_id)
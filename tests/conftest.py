@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app import cache
+from app.db import Base, get_db
+from app.deps import db_session_dep
+from app.main import app
+from app.models import User
+
+
+class FakeRedis:
+    """In-memory stand-in for the few redis.asyncio calls the app makes."""
+
+    def __init__(self) -> None:
+        self.store: dict[bytes, bytes] = {}
+
+    @staticmethod
+    def _key(key: str | bytes) -> bytes:
+        return key.encode() if isinstance(key, str) else key
+
+    async def get(self, key):
+        return self.store.get(self._key(key))
+
+    async def setex(self, key, ttl, value):
+        self.store[self._key(key)] = value
+
+    async def delete(self, key):
+        self.store.pop(self._key(key), None)
+
+
+class BrokenRedis:
+    async def get(self, key):
+        raise RedisConnectionError("redis is down")
+
+    async def setex(self, key, ttl, value):
+        raise RedisConnectionError("redis is down")
+
+    async def delete(self, key):
+        raise RedisConnectionError("redis is down")
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "_redis_client", client)
+    return client
+
+
+@pytest.fixture
+def broken_redis(monkeypatch):
+    client = BrokenRedis()
+    monkeypatch.setattr(cache, "_redis_client", client)
+    return client
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=NullPool)
+
+    async def create_tables() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_db():
+        async with factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[db_session_dep] = override_db
+    yield factory
+    app.dependency_overrides.clear()
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def add_rows(session_factory):
+    """Insert ORM objects and return them with generated ids loaded."""
+
+    def _add(*rows):
+        async def run():
+            async with session_factory() as db:
+                db.add_all(rows)
+                await db.commit()
+
+        asyncio.run(run())
+        return rows
+
+    return _add
+
+
+@pytest.fixture
+def user(add_rows):
+    (row,) = add_rows(User(email="ada@example.com", hashed_password="x", created_at=datetime(2024, 1, 1)))
+    return row
+
+
+@pytest.fixture
+def client(session_factory):
+    # No context manager: skip the lifespan so tests never touch real Postgres/Redis/Pub/Sub.
+    return TestClient(app)
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from app.models import ExampleItem
+
+
+def _item(slug: str, day: int) -> ExampleItem:
+    return ExampleItem(slug=slug, name=slug.title(), created_at=datetime(2024, 1, day))
+
+
+def test_items_revalidate_with_etag(client, add_rows, fake_redis):
+    add_rows(_item("first", 1))
+
+    response = client.get("/api/items")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    revalidated = client.get("/api/items", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+
+
+def test_items_revalidate_with_weak_etag(client, add_rows, fake_redis):
+    add_rows(_item("first", 1))
+    etag = client.get("/api/items").headers["etag"]
+
+    # Proxies and compressors often weaken ETags; If-None-Match uses weak comparison.
+    response = client.get("/api/items", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert response.status_code == 304
+
+
+def test_items_revalidate_with_wildcard(client, add_rows, fake_redis):
+    add_rows(_item("first", 1))
+    assert client.get("/api/items", headers={"If-None-Match": "*"}).status_code == 304
+
+
+def test_insert_invalidates_etag_and_cached_body(client, add_rows, fake_redis):
+    add_rows(_item("first", 1))
+    first = client.get("/api/items")
+    old_etag = first.headers["etag"]
+
+    add_rows(_item("second", 2))
+
+    # The old validator no longer matches and the body is rebuilt, not served from cache.
+    refreshed = client.get("/api/items", headers={"If-None-Match": old_etag})
+    assert refreshed.status_code == 200
+    new_etag = refreshed.headers["etag"]
+    assert new_etag != old_etag
+    assert [item["slug"] for item in refreshed.json()] == ["second", "first"]
+
+    assert client.get("/api/items", headers={"If-None-Match": new_etag}).status_code == 304
@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.auth import (
+    _COOKIE,
+    CurrentUser,
+    cache_user,
+    create_session_token,
+    get_user_id_from_token,
+    hash_password_async,
+    invalidate_user_cache,
+    require_role,
+    shutdown_password_pool,
+    verify_password,
+    verify_password_async,
+)
+from app.config import settings
+from app.models import User
+
+
+# Hash of "correct horse" produced by the previous passlib CryptContext.
+PASSLIB_HASH = "$2b$12$luBGysIdp7aN6iowK15AO.m0jK329Q1cBzPw9Zql/lqIaHPm1XQli"
+
+
+def _request_for(user_id: int) -> Request:
+    cookie = f"{_COOKIE}={create_session_token(user_id)}".encode()
+    return Request({"type": "http", "headers": [(b"cookie", cookie)]})
+
+
+def _delete_user(session_factory, user_id: int) -> None:
+    async def run():
+        async with session_factory() as db:
+            await db.delete(await db.get(User, user_id))
+            await db.commit()
+
+    asyncio.run(run())
+
+
+def test_passlib_hashes_still_verify():
+    assert verify_password("correct horse", PASSLIB_HASH)
+    assert not verify_password("wrong horse", PASSLIB_HASH)
+
+
+def test_session_token_round_trip():
+    assert get_user_id_from_token(create_session_token(42)) == 42
+
+
+def test_expired_session_token_is_rejected():
+    token = jwt.encode({"uid": 42, "exp": int(time.time()) - 1}, settings.secret_key, algorithm="HS256")
+    assert get_user_id_from_token(token) is None
+
+
+def test_authenticated_route_works_when_redis_is_down(client, user, broken_redis):
+    client.cookies.set(_COOKIE, create_session_token(user.id))
+    response = client.get("/dashboard")
+    assert response.status_code == 200
+    assert user.email in response.text
+
+
+def test_user_snapshot_is_served_from_cache_until_invalidated(client, user, fake_redis, session_factory):
+    client.cookies.set(_COOKIE, create_session_token(user.id))
+    assert client.get("/dashboard").status_code == 200
+    assert fake_redis.store
+
+    # With the row gone, only the cached snapshot can authenticate the request.
+    _delete_user(session_factory, user.id)
+    assert client.get("/dashboard").status_code == 200
+
+    asyncio.run(invalidate_user_cache(user.id))
+    assert client.get("/dashboard", follow_redirects=False).status_code == 401
+
+
+def test_password_pool_restarts_after_shutdown():
+    async def round_trip() -> bool:
+        hashed = await hash_password_async("pw")
+        return await verify_password_async("pw", hashed)
+
+    # Each lifespan shuts the pool down; a later one must still hash passwords.
+    for _ in range(2):
+        assert asyncio.run(round_trip())
+        shutdown_password_pool()
+
+
+def test_require_role_checks_cached_role_names(fake_redis):
+    snapshot = CurrentUser(id=7, email="ops@example.com", is_active=True, is_superuser=False, role_names=frozenset({"ops"}))
+    asyncio.run(cache_user(snapshot))
+
+    # Cache hit: no DB session needed, and the snapshot comes back as-is.
+    user = asyncio.run(require_role(_request_for(7), None, frozenset({"ops", "admin"})))
+    assert user == snapshot
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(require_role(_request_for(7), None, frozenset({"admin"})))
+    assert excinfo.value.status_code == 403
+
+
+def test_invalidate_user_cache_tolerates_redis_outage(broken_redis):
+    asyncio.run(invalidate_user_cache(1))
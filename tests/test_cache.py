@@ -0,0 +1,42 @@
+from datetime import date
+from uuid import UUID
+
+import pytest
+
+from app.cache import _default_key
+
+
+PREFIX = b"tests:fn:"
+
+
+def test_key_is_stable_across_calls():
+    assert _default_key(PREFIX, (1, "a"), {"b": None}) == _default_key(PREFIX, (1, "a"), {"b": None})
+
+
+def test_key_ignores_kwarg_order():
+    assert _default_key(PREFIX, (), {"a": 1, "b": 2}) == _default_key(PREFIX, (), {"b": 2, "a": 1})
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        (1, "1"),
+        (1, True),
+        ([1, 2], [1, 3]),
+        ((1, 2), [1, 2]),
+        (date(2024, 1, 1), date(2024, 1, 2)),
+        (UUID(int=1), UUID(int=2)),
+        (float("nan"), float("inf")),
+    ],
+)
+def test_distinct_arguments_get_distinct_keys(left, right):
+    assert _default_key(PREFIX, (left,), {}) != _default_key(PREFIX, (right,), {})
+
+
+def test_wide_ints_are_keyable():
+    assert _default_key(PREFIX, (2**70,), {}) != _default_key(PREFIX, (2**70 + 1,), {})
+
+
+def test_unkeyable_argument_requires_key_builder():
+    with pytest.raises(TypeError, match="key_builder"):
+        _default_key(PREFIX, (object(),), {})